@@ -1,12 +1,15 @@
 #!/usr/bin/python3
 
 import base64
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad
+import os
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 import argparse
 
 # Define the program description
-parser = argparse.ArgumentParser(description='Encrypt a private key using an AES key.')
+parser = argparse.ArgumentParser(
+    description='Encrypt a private key using an AES key (AES-256-GCM). '
+                'Values of ENCRYPTED_DATA produced by the older AES-CBC version of this script '
+                'can no longer be decrypted by the bot and must be re-encrypted.')
 
 # Define arguments
 parser.add_argument('aes_key', type=str, help='The plaintext data key you got from AWS KMS')
@@ -21,11 +24,12 @@ aes_key = base64.b64decode(args.aes_key)
 # This is the data you want to encrypt, e.g. your private key
 data = bytes.fromhex(args.private_key_hex)
 
-cipher = AES.new(aes_key, AES.MODE_CBC)
-ciphertext = cipher.encrypt(pad(data, AES.block_size))
+# AES-GCM encrypts and authenticates in a single pass (AES-NI + CLMUL via OpenSSL), no padding needed
+nonce = os.urandom(12)
+ciphertext = AESGCM(aes_key).encrypt(nonce, data, None)  # the 16-byte tag is appended to the ciphertext
 
-# Combine the iv (initialization vector) and the ciphertext, which you need both to decrypt the data
-encrypted_data = base64.b64encode(cipher.iv + ciphertext).decode('utf-8')
+# Combine the nonce and the ciphertext (with its tag), which you need both to decrypt the data
+encrypted_data = base64.b64encode(nonce + ciphertext).decode('utf-8')
 
 print(encrypted_data)
 
@@ -111,6 +111,20 @@ pub async fn create_unique_index(db: &Database) -> Result<(), Box<dyn error::Err
     Ok(())
 }
 
+pub async fn create_price_index(db: &Database) -> Result<(), Box<dyn error::Error>> {
+    // Serves TransactionLog::get_price_history, which filters by trader and sorts by timestamp
+    let options = IndexOptions::builder()
+        .name("trader_ts".to_string())
+        .build();
+    let model = IndexModel::builder()
+        .keys(doc! {"trader_name": 1, "price_point.timestamp": 1})
+        .options(options)
+        .build();
+    let collection = PriceLog::default().get_collection(db);
+    collection.create_index(model, None).await?;
+    Ok(())
+}
+
 #[async_trait]
 impl Entity for TradePosition {
     async fn insert(&self, db: &Database) -> Result<(), Box<dyn error::Error>> {
@@ -241,11 +255,16 @@ impl Entity for PriceLog {
     }
 
     async fn search(&self, db: &Database) -> Result<Vec<Self>, Box<dyn error::Error>> {
+        let collection = self.get_collection(db);
+        if self.id == None && !self.trader_name.is_empty() {
+            let query = doc! { "trader_name": self.trader_name.as_str() };
+            let sort = doc! { "price_point.timestamp": 1 };
+            return collection.search_sorted(query, sort).await;
+        }
         let mut query = doc! { "id": { "$gt": 0 }};
         if self.id != None {
             query = doc! { "id": self.id.unwrap() };
         }
-        let collection = self.get_collection(db);
         collection.search(query).await
     }
 
@@ -303,6 +322,11 @@ pub trait HelperCollection<T> {
     async fn delete(&self, query: Document) -> Result<(), Box<dyn error::Error>>;
     async fn delete_all(&self) -> Result<(), Box<dyn error::Error>>;
     async fn search(&self, query: Document) -> Result<Vec<T>, Box<dyn error::Error>>;
+    async fn search_sorted(
+        &self,
+        query: Document,
+        sort: Document,
+    ) -> Result<Vec<T>, Box<dyn error::Error>>;
 }
 
 #[async_trait]
@@ -340,9 +364,15 @@ where
     }
 
     async fn search(&self, query: Document) -> Result<Vec<T>, Box<dyn error::Error>> {
-        let find_options = FindOptions::builder()
-            .sort(doc! { "system_time": 1 })
-            .build();
+        self.search_sorted(query, doc! { "system_time": 1 }).await
+    }
+
+    async fn search_sorted(
+        &self,
+        query: Document,
+        sort: Document,
+    ) -> Result<Vec<T>, Box<dyn error::Error>> {
+        let find_options = FindOptions::builder().sort(sort).build();
         let mut items: Vec<T> = vec![];
         let mut cursor = self.find(query, find_options).await?;
         while let Some(item) = cursor.try_next().await? {
@@ -1,5 +1,5 @@
 use base64::{decode_config, STANDARD};
-use openssl::symm::{decrypt, Cipher};
+use openssl::symm::{decrypt_aead, Cipher};
 use rusoto_core::Region;
 use rusoto_kms::{DecryptRequest, Kms, KmsClient};
 use std::{env, str::FromStr};
@@ -35,12 +35,18 @@ pub async fn decrypt_data_with_kms() -> Result<Vec<u8>, Box<dyn std::error::Erro
         .plaintext
         .ok_or("Failed to decrypt the data key")?;
 
-    // decrypt the actual data
-    let decrypted_data = decrypt(
-        Cipher::aes_256_cbc(),
+    // decrypt and authenticate the actual data
+    if encrypted_data.len() < 12 + 16 {
+        return Err("Encrypted data is too short".into());
+    }
+    let tag_index = encrypted_data.len() - 16;
+    let decrypted_data = decrypt_aead(
+        Cipher::aes_256_gcm(),
         &decrypted_data_key,
-        Some(&encrypted_data[..16]), // the first 16 bytes is the IV
-        &encrypted_data[16..],       // the rest is the actual encrypted data
+        Some(&encrypted_data[..12]),    // the first 12 bytes is the nonce
+        &[],                            // no additional authenticated data
+        &encrypted_data[12..tag_index], // the actual encrypted data
+        &encrypted_data[tag_index..],   // the last 16 bytes is the tag
     )?;
 
     Ok(decrypted_data)
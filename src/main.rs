@@ -2,7 +2,7 @@
 
 use blockchain_factory::create_dexes;
 use config::EnvConfig;
-use db::create_unique_index;
+use db::{create_price_index, create_unique_index};
 use error_manager::ErrorManager;
 use ethers::signers::{LocalWallet, Signer};
 use ethers::types::Address;
@@ -66,6 +66,10 @@ async fn main() -> std::io::Result<()> {
     create_unique_index(&db)
         .await
         .expect("Error creating unique index");
+    if let Err(e) = create_price_index(&db).await {
+        // Only speeds up loading the price history, so don't refuse to start
+        log::warn!("create_price_index: {:?}", e);
+    }
 
     // Set up the transaction log
     let last_position_counter =
@@ -94,9 +98,6 @@ async fn main() -> std::io::Result<()> {
     // Read the last App state
     let app_state = TransactionLog::get_app_state(&db).await;
 
-    // Read the price histories
-    let price_histories = TransactionLog::get_price_histories(&db).await;
-
     // Initialize an empty vector to hold trader instances
     let mut trader_instances = prepare_trader_instances(
         &configs,
@@ -104,7 +105,6 @@ async fn main() -> std::io::Result<()> {
         transaction_log.clone(),
         app_state.prev_balance,
         app_state.trader_state,
-        price_histories,
     )
     .await;
 
@@ -122,7 +122,6 @@ async fn prepare_trader_instances(
     transaction_log: Arc<TransactionLog>,
     prev_balance: HashMap<String, Option<f64>>,
     trader_state: HashMap<String, TraderState>,
-    price_histories: HashMap<String, HashMap<String, Vec<PricePoint>>>,
 ) -> Vec<(
     ForcastTrader,
     WalletAndProvider,
@@ -147,7 +146,6 @@ async fn prepare_trader_instances(
             transaction_log.clone(),
             prev_balance.clone(),
             trader_state.clone(),
-            price_histories.clone(),
             open_positions_map.clone(),
             scores.clone(),
         )
@@ -164,7 +162,6 @@ async fn prepare_algorithm_trader_instance(
     transaction_log: Arc<TransactionLog>,
     prev_balance: HashMap<String, Option<f64>>,
     trader_state: HashMap<String, TraderState>,
-    price_histories: HashMap<String, HashMap<String, Vec<PricePoint>>>,
     open_positions_map: HashMap<String, HashMap<String, TradePosition>>,
     scores: HashMap<String, HashMap<String, f64>>,
 ) -> (
@@ -236,7 +233,7 @@ async fn prepare_algorithm_trader_instance(
         config.reward_multiplier,
         config.penalty_multiplier,
         client_holder.clone(),
-        transaction_log,
+        transaction_log.clone(),
         config.dex_index,
         config.slippage,
         open_positions_map,
@@ -245,9 +242,15 @@ async fn prepare_algorithm_trader_instance(
         config.save_prices,
     );
 
+    // Read this trader's price history
+    let price_history = match transaction_log.get_db(&client_holder).await {
+        Some(db) => TransactionLog::get_price_history(&db, trader.name()).await,
+        None => HashMap::new(),
+    };
+
     // Create and restore the price histories
     let mut histories: HashMap<String, PriceHistory> = HashMap::new();
-    restore_histories(&mut histories, &trader, &price_histories);
+    restore_histories(&mut histories, &trader, &price_history);
 
     // Do some initialization
     trader.rebalance(wallet.address(), true).await;
@@ -461,14 +464,9 @@ async fn handle_sleep_and_signal(interval: f64) -> Result<(), &'static str> {
 fn restore_histories(
     histories: &mut HashMap<String, PriceHistory>,
     trader: &ForcastTrader,
-    price_histories: &HashMap<String, HashMap<String, Vec<PricePoint>>>,
+    price_history: &HashMap<String, Vec<PricePoint>>,
 ) {
-    let price_pionts_map = match price_histories.get(trader.name()) {
-        Some(map) => map,
-        None => return,
-    };
-
-    for (token_name, price_point_vec) in price_pionts_map {
+    for (token_name, price_point_vec) in price_history {
         let history = histories
             .entry(token_name.clone())
             .or_insert_with(|| trader.create_price_history());
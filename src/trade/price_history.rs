@@ -337,11 +337,8 @@ impl PriceHistory {
 
         for i in (self.prices.len() - period)..self.prices.len() {
             let change = self.prices[i].price - self.prices[i - 1].price;
-            if change >= 0.0 {
-                gains += change;
-            } else {
-                losses += change.abs();
-            }
+            gains += change.max(0.0);
+            losses += (-change).max(0.0);
         }
 
         let avg_gain = gains / period as f64;
@@ -211,14 +211,17 @@ impl TransactionLog {
         Ok(())
     }
 
-    pub async fn get_price_histories(
+    pub async fn get_price_history(
         db: &Database,
-    ) -> HashMap<String, HashMap<String, Vec<PricePoint>>> {
-        let item = PriceLog::default();
+        trader_name: &str,
+    ) -> HashMap<String, Vec<PricePoint>> {
+        let mut item = PriceLog::default();
+        item.trader_name = trader_name.to_owned();
+        // The items come back sorted by timestamp, so each token's points stay in order
         let items = match search_items(db, &item).await {
             Ok(items) => items,
             Err(e) => {
-                log::warn!("get_price_histories: {:?}", e);
+                log::warn!("get_price_history: {:?}", e);
                 return HashMap::new();
             }
         };
@@ -227,19 +230,11 @@ impl TransactionLog {
 
         for price_log in items {
             result
-                .entry(price_log.trader_name)
-                .or_insert_with(HashMap::new)
                 .entry(price_log.token_name)
                 .or_insert_with(Vec::new)
                 .push(price_log.price_point);
         }
 
-        for (_, token_map) in &mut result {
-            for (_, price_points) in token_map {
-                price_points.sort_by_key(|pp| pp.timestamp);
-            }
-        }
-
         result
     }
 